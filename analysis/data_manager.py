@@ -1,7 +1,53 @@
+import functools
 import pandas as pd
-from typing import List, Optional, Union
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+from pandas.tseries.frequencies import to_offset
+from typing import List, Optional, Tuple, Union
 import os
 
+# Bytes of raw CSV parsed per block when streaming a source file
+_CSV_BLOCK_SIZE = 16 << 20
+
+# Shared by the whole-file and block-streaming CSV readers. OHLCV types are
+# explicit so the parser skips inference and every streamed block agrees.
+_CSV_CONVERT_OPTIONS = pa_csv.ConvertOptions(
+    column_types={
+        column: pa.float64() for column in ("Open", "High", "Low", "Close", "Volume")
+    },
+    timestamp_parsers=[pa_csv.ISO8601, "%Y-%m-%d %H:%M:%S", "%Y-%m-%d"],
+)
+
+_OHLCV_AGGREGATION = {
+    "Open": "first",
+    "High": "max",
+    "Low": "min",
+    "Close": "last",
+    "Volume": "sum",
+}
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_utc_timestamp(value) -> pd.Timestamp:
+    """
+    Parses a date bound as a UTC Timestamp. Repeated get_data calls reuse the
+    same bounds, so the parse result is cached.
+    """
+    return pd.to_datetime(value).tz_localize("UTC")
+
+
+def _import_polars():
+    """
+    Imports polars on first use, so callers that never resample do not pay its
+    import cost. Returns None when polars (an optional dependency) is not installed.
+    """
+    try:
+        import polars
+    except ImportError:
+        return None
+    return polars
+
 
 class DataManager:
     """
@@ -9,19 +55,68 @@ class DataManager:
     This manager reads 1-minute data and can resample it to any specified timeframe.
     """
 
-    def __init__(self, data_path: str = "./data", cache_path: str = "./cache"):
+    def __init__(
+        self,
+        data_path: str = "./data",
+        cache_path: str = "./cache",
+        memory_cache_size: int = 32,
+    ):
         """
         Initializes the DataManager.
 
         Args:
             data_path (str): The base directory where 1-minute CSV data is stored.
             cache_path (str): The directory to store cached (and resampled) data.
+            memory_cache_size (int): Number of loaded frames kept in memory.
         """
         self.data_path = data_path
         self.cache_path = cache_path
         os.makedirs(self.cache_path, exist_ok=True)
         os.makedirs(self.data_path, exist_ok=True)
 
+        # Per-instance LRU so repeated loads skip the Parquet decode entirely
+        self._load_full = functools.lru_cache(maxsize=memory_cache_size)(
+            self._load_full
+        )
+
+    def refresh(self) -> None:
+        """
+        Clears the in-memory cache so the next read goes back to disk.
+        """
+        self._load_full.cache_clear()
+
+    def _read_source_csv(self, source_file: str) -> pd.DataFrame:
+        """
+        Reads a 1-minute source CSV with the multithreaded PyArrow parser.
+        The first column is used as the datetime index.
+        """
+        table = pa_csv.read_csv(source_file, convert_options=_CSV_CONVERT_OPTIONS)
+        df = table.to_pandas(self_destruct=True, date_as_object=False)
+        return df.set_index(df.columns[0])
+
+    def _stream_resample_csv(self, source_file: str, timeframe: str) -> pd.DataFrame:
+        """
+        Resamples a 1-minute source CSV block by block, so only one block of raw
+        rows is held in memory at a time. A bar can straddle a block boundary, so
+        the partial bars are merged once all blocks have been read.
+        """
+        reader = pa_csv.open_csv(
+            source_file,
+            read_options=pa_csv.ReadOptions(block_size=_CSV_BLOCK_SIZE),
+            convert_options=_CSV_CONVERT_OPTIONS,
+        )
+        partial_bars = []
+        for batch in reader:
+            chunk = batch.to_pandas(date_as_object=False)
+            chunk = chunk.set_index(chunk.columns[0])
+            chunk.index = pd.to_datetime(chunk.index)
+            partial_bars.append(self._resample_data(chunk, timeframe))
+
+        bars = pd.concat(partial_bars)
+        if bars.index.has_duplicates:
+            bars = bars.groupby(level=0, sort=True).agg(_OHLCV_AGGREGATION)
+        return bars
+
     def _resample_data(self, df: pd.DataFrame, timeframe: str) -> pd.DataFrame:
         """
         Resamples 1-minute data to a larger timeframe.
@@ -31,27 +126,138 @@ class DataManager:
         else:
             df.index = df.index.tz_convert("UTC")
 
-        ohlc = {
-            "Open": "first",
-            "High": "max",
-            "Low": "min",
-            "Close": "last",
-            "Volume": "sum",
-        }
+        every = self._polars_duration(timeframe)
+        if every is not None:
+            return self._resample_data_polars(df, every)
 
         # Use 'base' parameter to align the resampling to the start of the interval
         resampled_df = (
-            df.resample(timeframe, label="left", closed="left").agg(ohlc).dropna()
+            df.resample(timeframe, label="left", closed="left")
+            .agg(_OHLCV_AGGREGATION)
+            .dropna()
         )
 
         return resampled_df
 
+    def _polars_duration(self, timeframe: str) -> Optional[str]:
+        """
+        Converts a pandas timeframe to a Polars duration string, or returns None
+        if Polars is unavailable or its epoch-aligned windows would not match
+        pandas' day-aligned bins (calendar or non-day-dividing frequencies).
+        """
+        if _import_polars() is None:
+            return None
+        try:
+            step_ns = pd.Timedelta(to_offset(timeframe)).value
+        except ValueError:
+            return None
+        if step_ns <= 0 or pd.Timedelta(days=1).value % step_ns != 0:
+            return None
+        return f"{step_ns}ns"
+
+    def _resample_data_polars(self, df: pd.DataFrame, every: str) -> pd.DataFrame:
+        """
+        Resamples 1-minute data with Polars' multithreaded group_by_dynamic.
+        """
+        pl = _import_polars()
+        index_name = df.index.name or "index"
+        resampled = (
+            pl.from_pandas(df.reset_index())
+            .lazy()
+            .sort(index_name)
+            .group_by_dynamic(index_name, every=every, closed="left", label="left")
+            .agg(
+                [
+                    pl.col("Open").first(),
+                    pl.col("High").max(),
+                    pl.col("Low").min(),
+                    pl.col("Close").last(),
+                    pl.col("Volume").sum(),
+                ]
+            )
+            .collect()
+            .to_pandas()
+            .set_index(index_name)
+        )
+        return resampled.dropna()
+
+    def _load_full(
+        self,
+        symbol: str,
+        timeframe: str,
+        columns: Optional[Tuple[str, ...]],
+        start_year: Optional[int] = None,
+        end_year: Optional[int] = None,
+    ) -> pd.DataFrame:
+        """
+        Loads the data for a symbol and timeframe, from the Parquet cache if
+        present, otherwise by resampling the 1-minute source. The cache is
+        partitioned by year, so only partitions within [start_year, end_year]
+        are read. Results are memoized; get_data hands out copies.
+        """
+        cache_dir = f"{self.cache_path}/{symbol.upper()}_{timeframe}"
+        if columns is not None:
+            columns = list(columns)
+
+        # 1. Try loading from cache
+        if os.path.isdir(cache_dir):
+            filters = []
+            if start_year is not None:
+                filters.append(("year", ">=", start_year))
+            if end_year is not None:
+                filters.append(("year", "<=", end_year))
+            dataset = pq.ParquetDataset(cache_dir, filters=filters or None)
+            table = dataset.read(
+                columns=columns, use_threads=True, use_pandas_metadata=True
+            )
+            df = table.to_pandas(self_destruct=True, split_blocks=True)
+            df = df.drop(columns="year", errors="ignore")
+            if not df.index.is_monotonic_increasing:
+                df = df.sort_index()
+            return df
+
+        # 2. If cache miss, load 1-minute source data
+        source_file = f"{self.data_path}/{symbol.upper()}.csv"
+        if not os.path.exists(source_file):
+            raise FileNotFoundError(f"Source file not found: {source_file}")
+
+        try:
+            # 3. Resample the data, streaming the source unless it is kept at 1m
+            if timeframe == "1m":
+                df = self._read_source_csv(source_file)
+                df.index = pd.to_datetime(df.index)
+                if df.index.tz is None:
+                    df.index = df.index.tz_localize("UTC")
+                else:
+                    df.index = df.index.tz_convert("UTC")
+            else:
+                df = self._stream_resample_csv(source_file, timeframe)
+
+            # 4. Save the resampled data to cache
+            df.assign(year=df.index.year).to_parquet(
+                cache_dir,
+                engine="pyarrow",
+                partition_cols=["year"],
+                compression="zstd",
+                compression_level=3,
+                row_group_size=64 * 1024,
+                use_dictionary=True,
+                data_page_size=1 << 20,
+            )
+        except Exception as e:
+            raise RuntimeError(f"Error processing source file {source_file}: {e}") from e
+
+        if columns is not None:
+            df = df[columns]
+        return df
+
     def get_data(
         self,
         symbol: str,
         start_date: Optional[str] = None,
         end_date: Optional[str] = None,
         timeframe: str = "1d",
+        columns: Optional[List[str]] = None,
     ) -> Optional[pd.DataFrame]:
         """
         Loads data for a given symbol and timeframe. It first checks the cache
@@ -63,48 +269,35 @@ class DataManager:
             start_date (Optional[str]): The start date in 'YYYY-MM-DD' format.
             end_date (Optional[str]): The end date in 'YYYY-MM-DD' format.
             timeframe (str): The target data timeframe (e.g., '5m', '1h', '1d').
+            columns (Optional[List[str]]): Subset of columns to load. Defaults to all columns.
 
         Returns:
             Optional[pd.DataFrame]: A DataFrame with the loaded and resampled data, or None if not found.
         """
-        cache_file = f"{self.cache_path}/{symbol.upper()}_{timeframe}.parquet"
-
-        # 1. Try loading from cache
-        if os.path.exists(cache_file):
-            df = pd.read_parquet(cache_file)
-        else:
-            # 2. If cache miss, load 1-minute source data
-            source_file = f"{self.data_path}/{symbol.upper()}.csv"
-            if not os.path.exists(source_file):
-                print(f"Source file not found: {source_file}")
-                return None
-
-            try:
-                df_1m = pd.read_csv(source_file, index_col=0, parse_dates=True)
-                df_1m.index = pd.to_datetime(df_1m.index)
-                if df_1m.index.tz is None:
-                    df_1m.index = df_1m.index.tz_localize("UTC")
-                else:
-                    df_1m.index = df_1m.index.tz_convert("UTC")
-
-                # 3. Resample the data
-                if timeframe == "1m":
-                    df = df_1m
-                else:
-                    df = self._resample_data(df_1m, timeframe)
-
-                # 4. Save the resampled data to cache
-                df.to_parquet(cache_file)
-
-            except Exception as e:
-                print(f"Error processing source file {source_file}: {e}")
-                return None
+        start_ts = _parse_utc_timestamp(start_date) if start_date else None
+        end_ts = _parse_utc_timestamp(end_date) if end_date else None
+        try:
+            df = self._load_full(
+                symbol,
+                timeframe,
+                tuple(columns) if columns is not None else None,
+                start_ts.year if start_ts is not None else None,
+                end_ts.year if end_ts is not None else None,
+            )
+        except (FileNotFoundError, RuntimeError) as e:
+            print(e)
+            return None
 
         # 5. Filter by date range
-        if df is not None and not df.empty:
-            if start_date:
-                df = df[df.index >= pd.to_datetime(start_date).tz_localize("UTC")]
-            if end_date:
-                df = df[df.index <= pd.to_datetime(end_date).tz_localize("UTC")]
+        # The index is sorted, so a binary search gives the slice bounds directly
+        if not df.empty:
+            start_pos, end_pos = 0, len(df)
+            if start_ts is not None:
+                start_pos = df.index.searchsorted(start_ts, side="left")
+            if end_ts is not None:
+                end_pos = df.index.searchsorted(end_ts, side="right")
+            df = df.iloc[start_pos:end_pos]
 
-        return df
+        # The memoized frame is shared; give each caller its own copy, which
+        # costs far less than the Parquet decode the cache saves
+        return df.copy()
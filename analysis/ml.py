@@ -1,6 +1,11 @@
 import pandas as pd
+from joblib import Parallel, delayed
+from sklearn.base import clone
 from sklearn.model_selection import train_test_split, TimeSeriesSplit
-from sklearn.ensemble import RandomForestClassifier, GradientBoostingRegressor
+from sklearn.ensemble import (
+    GradientBoostingRegressor,
+    HistGradientBoostingClassifier,
+)
 from sklearn.linear_model import LinearRegression
 from sklearn.metrics import (
     accuracy_score,
@@ -9,7 +14,11 @@ from sklearn.metrics import (
     mean_squared_error,
 )
 from typing import Tuple, List, Optional, Dict, Any
+import glob
+import hashlib
+import os
 import numpy as np
+import pyarrow.parquet as pq
 
 
 def create_lagged_features(
@@ -20,16 +29,44 @@ def create_lagged_features(
 
     Args:
         df (pd.DataFrame): The input DataFrame.
-        lags (List[int]): A list of integers representing the number of periods to lag.
+        lags (List[int]): A list of distinct non-negative integers representing the number of periods to lag.
         target_column (str): The column to create lagged features from.
 
     Returns:
         pd.DataFrame: A new DataFrame with lagged features.
     """
-    df_features = pd.DataFrame(index=df.index)
-    for lag in lags:
-        df_features[f"{target_column}_lag_{lag}"] = df[target_column].shift(lag)
-    return df_features.dropna()
+    lag_array = np.asarray(lags, dtype=np.intp)
+    if lag_array.size and (
+        not all(isinstance(lag, (int, np.integer)) for lag in lags)
+        or lag_array.min() < 0
+        or len(np.unique(lag_array)) != lag_array.size
+    ):
+        raise ValueError(f"lags must be distinct non-negative integers, got {list(lags)}")
+
+    columns = [f"{target_column}_lag_{lag}" for lag in lags]
+    values = df[target_column].to_numpy()
+    max_lag = int(lag_array.max()) if lag_array.size else 0
+    if len(values) <= max_lag:
+        return pd.DataFrame(columns=columns, index=df.index[:0])
+
+    # Row i of the window view holds values[i : i + max_lag + 1], so the value
+    # lagged by `lag` relative to row i + max_lag sits at column max_lag - lag.
+    windows = np.lib.stride_tricks.sliding_window_view(values, max_lag + 1)
+    lagged = windows[:, max_lag - lag_array]
+    return pd.DataFrame(lagged, index=df.index[max_lag:], columns=columns)
+
+
+def _future_values(series: pd.Series, periods: int) -> pd.Series:
+    """
+    Equivalent to series.shift(-periods).dropna(), but the trailing rows are
+    trimmed by position so the NaN scan only runs over the data itself.
+    """
+    n = max(len(series) - periods, 0)
+    future = pd.Series(
+        series.to_numpy()[periods:], index=series.index[:n], name=series.name
+    )
+    has_value = future.notna().to_numpy()
+    return future if has_value.all() else future[has_value]
 
 
 def create_target_binary(
@@ -46,10 +83,18 @@ def create_target_binary(
     Returns:
         pd.Series: A Series with binary target values.
     """
-    future_price = df[column].shift(-periods).dropna()
-    current_price = df[column].loc[future_price.index]
-    target_bool = future_price > current_price
-    return target_bool.astype(int)
+    values = df[column].to_numpy()
+    n = max(len(values) - periods, 0)
+    current_price, future_price = values[:n], values[periods:]
+    target = pd.Series(
+        (future_price > current_price).astype(np.int8), index=df.index[:n]
+    )
+
+    # Rows whose future price is missing have no target
+    has_future = pd.notna(future_price)
+    if not has_future.all():
+        target = target[has_future]
+    return target
 
 
 def create_target_regression(
@@ -66,13 +111,122 @@ def create_target_regression(
     Returns:
         pd.Series: A Series with regression target values.
     """
-    return df[column].shift(-periods).dropna()
+    return _future_values(df[column], periods)
+
+
+def _source_signature(data_manager: Any, symbol: str, timeframe: str) -> Tuple:
+    """
+    Returns (path, mtime_ns, size) for the DataManager's source CSV and the files
+    of its Parquet cache for a symbol and timeframe. Paths that do not exist are
+    left out, so the signature changes whenever either source is rewritten.
+    """
+    symbol = symbol.upper()
+    paths = [os.path.join(str(data_manager.data_path), f"{symbol}.csv")]
+    cache_dir = os.path.join(str(data_manager.cache_path), f"{symbol}_{timeframe}")
+    for root, _, files in os.walk(cache_dir):
+        paths.extend(os.path.join(root, name) for name in files)
+
+    signature = []
+    for path in sorted(paths):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        signature.append((path, stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
+
+
+def _hash_key(value: Any) -> str:
+    return hashlib.blake2b(repr(value).encode()).hexdigest()[:16]
+
+
+def _features_cache_file(
+    data_manager: Any, symbol: str, timeframe: str, params_key: str
+) -> str:
+    """
+    Returns features_{params_key}_{source_key}.parquet in the cache directory,
+    where source_key hashes the current state of the symbol's source data.
+    """
+    source_key = _hash_key(_source_signature(data_manager, symbol, timeframe))
+    return os.path.join(
+        data_manager.cache_path, f"features_{params_key}_{source_key}.parquet"
+    )
+
+
+def build_or_load_features(
+    symbol: str,
+    timeframe: str,
+    lags: List[int],
+    data_manager: Any,
+    target: str = "binary",
+    column: str = "Close",
+    periods: int = 1,
+) -> Optional[Tuple[pd.DataFrame, pd.Series]]:
+    """
+    Builds lagged features and an aligned target for a symbol, caching the result
+    as Parquet in the DataManager's cache directory. Subsequent calls with the same
+    arguments load the cached matrices instead of rebuilding them. The cache key
+    includes the modification time and size of the source CSV and of the
+    DataManager's Parquet cache, so refreshed data is never served stale;
+    superseded files for the same arguments are removed when a new one is written.
+
+    Args:
+        symbol (str): The ticker symbol to load.
+        timeframe (str): The data timeframe (e.g., '1h', '1d').
+        lags (List[int]): A list of integers representing the number of periods to lag.
+        data_manager (Any): The DataManager used to load price data on a cache miss.
+        target (str): 'binary' for an up/down target, 'regression' for the future price.
+        column (str): The column to build features and the target from.
+        periods (int): The number of periods ahead for the target.
+
+    Returns:
+        Optional[Tuple[pd.DataFrame, pd.Series]]: The feature DataFrame and target
+            Series, or None if no data is found.
+    """
+    if target not in ("binary", "regression"):
+        raise ValueError(f"Unknown target '{target}'. Use 'binary' or 'regression'.")
+
+    params_key = _hash_key((symbol.upper(), timeframe, tuple(lags), target, column, periods))
+    cache_file = _features_cache_file(data_manager, symbol, timeframe, params_key)
+
+    if os.path.exists(cache_file):
+        df = pq.read_table(cache_file, use_threads=True).to_pandas(self_destruct=True)
+        return df.drop(columns="target"), df["target"]
+
+    df = data_manager.get_data(symbol, timeframe=timeframe)
+    if df is None:
+        return None
+
+    features = create_lagged_features(df, lags, target_column=column)
+    if target == "binary":
+        y = create_target_binary(df, column=column, periods=periods)
+    else:
+        y = create_target_regression(df, column=column, periods=periods)
+
+    common_index = features.index.intersection(y.index)
+    X = features.loc[common_index]
+    y = y.loc[common_index].rename("target")
+    # Loading may have written the DataManager's Parquet cache, so key the
+    # matrices on the sources as they are now
+    cache_file = _features_cache_file(data_manager, symbol, timeframe, params_key)
+    stale_pattern = os.path.join(
+        glob.escape(str(data_manager.cache_path)), f"features_{params_key}_*.parquet"
+    )
+    for stale in glob.glob(stale_pattern):
+        try:
+            os.remove(stale)
+        except FileNotFoundError:
+            pass
+    X.assign(target=y).to_parquet(cache_file, engine="pyarrow", compression="zstd")
+    return X, y
 
 
 def train_model(
     X: pd.DataFrame,
     y: pd.Series,
-    model: Any = RandomForestClassifier(n_estimators=100, random_state=42),
+    model: Any = HistGradientBoostingClassifier(
+        max_iter=200, learning_rate=0.1, max_bins=255, random_state=42
+    ),
     is_regression: bool = False,
 ) -> Tuple[Any, Dict[str, float]]:
     """
@@ -81,12 +235,14 @@ def train_model(
     Args:
         X (pd.DataFrame): Feature DataFrame.
         y (pd.Series): Target Series.
-        model (Any): The machine learning model to train. Defaults to RandomForestClassifier.
+        model (Any): The machine learning model to train. Defaults to HistGradientBoostingClassifier.
         is_regression (bool): True if it's a regression task, False for classification.
 
     Returns:
         Tuple[Any, Dict[str, float]]: A tuple containing the trained model and a dictionary of metrics.
     """
+    # Fit on the DataFrame itself: float64 prices keep their precision and the
+    # model records feature_names_in_ for predict_with_model
     X_train, X_test, y_train, y_test = train_test_split(
         X, y, test_size=0.2, shuffle=False, random_state=42
     )
@@ -123,25 +279,50 @@ def evaluate_regression_model(
     }
 
 
+def _fit_and_evaluate_fold(
+    model: Any,
+    X_train: pd.DataFrame,
+    y_train: pd.Series,
+    X_test: pd.DataFrame,
+    y_test: pd.Series,
+    is_regression: bool,
+) -> Tuple[Any, Dict[str, float]]:
+    """
+    Fits a model on one cross-validation fold and scores it on the held-out part.
+    """
+    model.fit(X_train, y_train)
+    y_pred = model.predict(X_test)
+    if is_regression:
+        return model, evaluate_regression_model(y_test, y_pred)
+    return model, {"accuracy": accuracy_score(y_test, y_pred)}
+
+
 def train_model_with_cv(
     X: pd.DataFrame,
     y: pd.Series,
     model: Any,
     n_splits: int = 5,
     is_regression: bool = False,
+    n_jobs: int = -1,
 ) -> Tuple[Any, Dict[str, List[float]]]:
     """
     Trains and evaluates a model using time-series cross-validation.
+    Folds are independent, so each one is fitted on a clone of the model and
+    they can run in parallel. The model passed in is left unfitted; the
+    returned model is the fitted clone from the last fold.
 
     Args:
         X (pd.DataFrame): Feature DataFrame.
         y (pd.Series): Target Series.
-        model (Any): The machine learning model to train.
+        model (Any): The machine learning model to train (used as a template, not fitted itself).
         n_splits (int): Number of splits for TimeSeriesSplit.
         is_regression (bool): True if it's a regression task, False for classification.
+        n_jobs (int): Number of parallel jobs for fold training. -1 uses all cores;
+            pass 1 to train the folds serially.
 
     Returns:
-        Tuple[Any, Dict[str, List[float]]]: A tuple containing the last trained model and a dictionary of metrics per fold.
+        Tuple[Any, Dict[str, List[float]]]: A tuple containing the fitted clone from
+            the last fold and a dictionary of metrics per fold.
     """
     tscv = TimeSeriesSplit(n_splits=n_splits)
     fold_metrics = {
@@ -150,23 +331,23 @@ def train_model_with_cv(
             ["accuracy"] if not is_regression else ["mae", "mse", "rmse", "r2"]
         )
     }
-    last_model = None
-
-    for train_index, test_index in tscv.split(X):
-        X_train, X_test = X.iloc[train_index], X.iloc[test_index]
-        y_train, y_test = y.iloc[train_index], y.iloc[test_index]
-
-        model.fit(X_train, y_train)
-        y_pred = model.predict(X_test)
-
-        if is_regression:
-            metrics = evaluate_regression_model(y_test, y_pred)
-            for metric_name, value in metrics.items():
-                fold_metrics[metric_name].append(value)
-        else:
-            fold_metrics["accuracy"].append(accuracy_score(y_test, y_pred))
+    results = Parallel(n_jobs=n_jobs, backend="loky", batch_size=1)(
+        delayed(_fit_and_evaluate_fold)(
+            clone(model),
+            X.iloc[train_index],
+            y.iloc[train_index],
+            X.iloc[test_index],
+            y.iloc[test_index],
+            is_regression,
+        )
+        for train_index, test_index in tscv.split(X)
+    )
 
-        last_model = model  # Keep the last trained model
+    last_model = None
+    for fold_model, metrics in results:
+        for metric_name, value in metrics.items():
+            fold_metrics[metric_name].append(value)
+        last_model = fold_model  # Keep the last trained model
 
     return last_model, fold_metrics
 
@@ -182,7 +363,9 @@ def predict_with_model(model: Any, X_new: pd.DataFrame) -> pd.Series:
     Returns:
         pd.Series: A Series of predictions.
     """
-    return pd.Series(model.predict(X_new), index=X_new.index)
+    # Pass the DataFrame so sklearn can check it against feature_names_in_
+    predictions = model.predict(X_new)
+    return pd.Series(predictions, index=X_new.index, dtype=predictions.dtype, copy=False)
 
 
 def predict_baseline_mid_price(
@@ -200,7 +383,7 @@ def predict_baseline_mid_price(
         pd.Series: A Series of baseline predictions.
     """
     # Get the index of the actual target values
-    actual_target_index = df[column].shift(-periods).dropna().index
+    actual_target_index = _future_values(df[column], periods).index
 
     # The baseline prediction for each date in actual_target_index is the mid_price of that same date
     return df[column].loc[actual_target_index]
@@ -1,5 +1,5 @@
+import numpy as np
 import pandas as pd
-import ta
 
 
 def calculate_sma(df: pd.DataFrame, window: int, column: str = "Close") -> pd.Series:
@@ -14,7 +14,9 @@ def calculate_sma(df: pd.DataFrame, window: int, column: str = "Close") -> pd.Se
     Returns:
         pd.Series: A Series containing the SMA values.
     """
-    return ta.trend.sma_indicator(df[column], window, fillna=False)
+    return (
+        df[column].rolling(window=window, min_periods=window).mean().rename(f"sma_{window}")
+    )
 
 
 def calculate_ema(df: pd.DataFrame, window: int, column: str = "Close") -> pd.Series:
@@ -29,7 +31,12 @@ def calculate_ema(df: pd.DataFrame, window: int, column: str = "Close") -> pd.Se
     Returns:
         pd.Series: A Series containing the EMA values.
     """
-    return ta.trend.ema_indicator(df[column], window, fillna=False)
+    return (
+        df[column]
+        .ewm(span=window, min_periods=window, adjust=False)
+        .mean()
+        .rename(f"ema_{window}")
+    )
 
 
 def calculate_rsi(df: pd.DataFrame, window: int, column: str = "Close") -> pd.Series:
@@ -44,8 +51,23 @@ def calculate_rsi(df: pd.DataFrame, window: int, column: str = "Close") -> pd.Se
     Returns:
         pd.Series: A Series containing the RSI values.
     """
-    df_lower = df.rename(columns=str.lower)
-    return ta.momentum.rsi(df_lower[column.lower()], window, fillna=False)
+    # Match the column case-insensitively without copying the whole frame
+    columns = {str(c).lower(): c for c in df.columns}
+    close = df[columns[column.lower()]].to_numpy(dtype=float)
+
+    # Wilder smoothing of gains and losses in a single EWM pass over both columns
+    diff = np.diff(close, prepend=np.nan)
+    moves = np.column_stack((np.where(diff > 0, diff, 0.0), np.where(diff < 0, -diff, 0.0)))
+    smoothed = (
+        pd.DataFrame(moves)
+        .ewm(alpha=1 / window, min_periods=window, adjust=False)
+        .mean()
+        .to_numpy()
+    )
+    avg_gain, avg_loss = smoothed[:, 0], smoothed[:, 1]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rsi = np.where(avg_loss == 0, 100.0, 100 - 100 / (1 + avg_gain / avg_loss))
+    return pd.Series(rsi, index=df.index, name="rsi")
 
 
 def calculate_bollinger_bands(
@@ -63,15 +85,16 @@ def calculate_bollinger_bands(
     Returns:
         pd.DataFrame: A DataFrame with 'bb_bbm', 'bb_bbh', 'bb_bbl' columns.
     """
-    bollinger = ta.volatility.BollingerBands(
-        close=df[column], window=window, window_dev=window_dev, fillna=False
-    )
+    rolling = df[column].rolling(window, min_periods=window)
+    mavg = rolling.mean().to_numpy()
+    band_width = window_dev * rolling.std(ddof=0).to_numpy()
     return pd.DataFrame(
         {
-            "bb_bbm": bollinger.bollinger_mavg(),
-            "bb_bbh": bollinger.bollinger_hband(),
-            "bb_bbl": bollinger.bollinger_lband(),
-        }
+            "bb_bbm": mavg,
+            "bb_bbh": mavg + band_width,
+            "bb_bbl": mavg - band_width,
+        },
+        index=df.index,
     )
 
 
@@ -1,33 +1,170 @@
 import os
+import copy
+import csv
+import functools
+from concurrent.futures import ThreadPoolExecutor
 import json
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
 import shutil
 import logging
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
-def convert_numpy_types(obj):
-    if isinstance(obj, dict):
-        return {k: convert_numpy_types(v) for k, v in obj.items()}
-    elif isinstance(obj, list):
-        return [convert_numpy_types(i) for i in obj]
-    elif isinstance(obj, np.integer):
+def _json_default(obj):
+    """
+    Fallback serializer for types neither orjson nor json handle natively.
+    """
+    if isinstance(obj, np.integer):
         return int(obj)
-    elif isinstance(obj, np.floating):
+    if isinstance(obj, np.floating):
         return float(obj)
-    elif isinstance(obj, np.ndarray):
+    if isinstance(obj, np.ndarray):
         return obj.tolist()
-    return obj
+    if isinstance(obj, (pd.Timestamp, pd.Timedelta)):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dump_json(obj, path):
+    """
+    Writes obj as JSON with two-space indentation, the only indent orjson
+    supports, so the files look the same with or without orjson.
+    """
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(obj, default=_json_default,
+                                 option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_INDENT_2))
+    else:
+        with open(path, "w") as f:
+            json.dump(obj, f, indent=2, default=_json_default)
+
+
+_NON_FINITE = {"nan": np.nan, "inf": np.inf, "-inf": -np.inf}
+
+
+def _encode_metrics(metrics):
+    """
+    JSON has no NaN/Infinity (orjson writes them as null), so non-finite
+    metric values are stored as the strings "nan", "inf" and "-inf".
+    """
+    return {
+        k: str(float(v)) if isinstance(v, float) and not np.isfinite(v) else v
+        for k, v in metrics.items()
+    }
+
+
+def _decode_metrics(metrics):
+    return {
+        k: _NON_FINITE[v] if isinstance(v, str) and v in _NON_FINITE else v
+        for k, v in metrics.items()
+    }
+
+
+def _load_json(path):
+    with open(path, "rb") as f:
+        data = f.read()
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # Files written by json.dump may hold bare NaN/Infinity tokens,
+            # which orjson rejects; the stdlib parser accepts them
+            pass
+    return json.loads(data)
+
+# Portfolio frames written by save_backtest -> datetime columns to parse when
+# reading them back from CSV (Parquet keeps the dtypes itself)
+_PORTFOLIO_FRAMES = {
+    "equity_curve": True,
+    "all_positions": ["datetime"],
+    "all_holdings": ["datetime"],
+    "closed_trades": ["entry_time", "exit_time"],
+}
+
+
+_WRITE_BUFFER_SIZE = 1 << 20
+_CSV_CHUNK_ROWS = 100_000
+
+_PLOT_SUFFIXES = (".png", ".jpg", ".html")
+
+
+def _write_rows(rows, path, file_format):
+    """
+    Writes a homogeneous list of dicts (one per bar) without building a
+    DataFrame: an Arrow table for Parquet, a buffered DictWriter for CSV.
+    """
+    if file_format == "csv":
+        with open(path, "w", newline="", buffering=_WRITE_BUFFER_SIZE) as f:
+            writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+            writer.writeheader()
+            writer.writerows(rows)
+        return
+
+    try:
+        table = pa.Table.from_pylist(rows)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # Mixed value types in a column; let pandas infer an object column
+        pd.DataFrame(rows).to_parquet(path, engine="pyarrow", compression="zstd", index=False)
+        return
+    # Arrow infers microseconds from Timestamps; keep pandas' nanosecond unit
+    schema = pa.schema([
+        field.with_type(pa.timestamp("ns", tz=field.type.tz))
+        if pa.types.is_timestamp(field.type) else field
+        for field in table.schema
+    ])
+    pq.write_table(table.cast(schema), path, compression="zstd")
+
+
+def _read_frame(backtest_path, name):
+    """
+    Reads one saved portfolio frame, preferring Parquet over CSV from older
+    runs. Returns None if neither exists.
+    """
+    parquet_path = os.path.join(backtest_path, f"{name}.parquet")
+    if os.path.exists(parquet_path):
+        return pd.read_parquet(parquet_path, engine="pyarrow")
+    csv_path = os.path.join(backtest_path, f"{name}.csv")
+    if os.path.exists(csv_path):
+        index_col = 0 if name == "equity_curve" else None
+        return pd.read_csv(csv_path, index_col=index_col, parse_dates=_PORTFOLIO_FRAMES[name])
+    return None
+
+
+def _move_into(filepath, dest_dir):
+    """
+    Moves a file into dest_dir: a rename on the same filesystem, a copy and
+    delete across filesystems. Files already in dest_dir are left alone.
+    """
+    if not os.path.exists(filepath):
+        return
+    if os.path.samefile(os.path.dirname(os.path.abspath(filepath)), dest_dir):
+        return
+    dest = os.path.join(dest_dir, os.path.basename(filepath))
+    if os.stat(filepath).st_dev == os.stat(dest_dir).st_dev:
+        os.replace(filepath, dest)
+    else:
+        shutil.move(filepath, dest)
+
 
 class BacktestManager:
     """
     Manages saving and loading of backtest results.
     """
-    def __init__(self, base_dir="backtest_results"):
+    def __init__(self, base_dir="backtest_results", cache_size=64):
         self.base_dir = base_dir
-        os.makedirs(self.base_dir, exist_ok=True)
+        os.makedirs(base_dir, exist_ok=True)
+        # Per-instance LRU keyed on (name, directory signature); bounded so
+        # large equity curves are not kept alive forever
+        self._load_cached = functools.lru_cache(maxsize=cache_size)(self._load_uncached)
 
     def _get_backtest_path(self, backtest_name):
         return os.path.join(self.base_dir, backtest_name)
@@ -38,87 +175,123 @@ class BacktestManager:
         portfolio_obj,
         backtest_params,
         performance_metrics,
-        plot_filepaths
+        plot_filepaths,
+        file_format="parquet",
+        plots_in_place=False
     ):
         """
         Saves all relevant backtest data and results.
+
+        Portfolio frames are written as zstd-compressed Parquet by default;
+        pass file_format="csv" for plain-text output. Set plots_in_place
+        when the plots were already written into the backtest directory.
         """
+        if file_format not in ("parquet", "csv"):
+            raise ValueError(f"Unsupported file_format: {file_format}")
+
         backtest_path = self._get_backtest_path(backtest_name)
         os.makedirs(backtest_path, exist_ok=True)
 
         # Save portfolio data
+        frames = {}
         if not portfolio_obj.equity_curve.empty:
-            portfolio_obj.equity_curve.to_csv(os.path.join(backtest_path, "equity_curve.csv"))
-        
-        # Convert list of dicts to DataFrame for easier saving
-        if portfolio_obj.all_positions:
-            pd.DataFrame(portfolio_obj.all_positions).to_csv(os.path.join(backtest_path, "all_positions.csv"), index=False)
-        if portfolio_obj.all_holdings:
-            pd.DataFrame(portfolio_obj.all_holdings).to_csv(os.path.join(backtest_path, "all_holdings.csv"), index=False)
+            frames["equity_curve"] = portfolio_obj.equity_curve
         if portfolio_obj.closed_trades:
-            pd.DataFrame(portfolio_obj.closed_trades).to_csv(os.path.join(backtest_path, "closed_trades.csv"), index=False)
+            frames["closed_trades"] = pd.DataFrame(portfolio_obj.closed_trades)
+
+        for name, df in frames.items():
+            keep_index = name == "equity_curve"
+            path = os.path.join(backtest_path, f"{name}.{file_format}")
+            if file_format == "parquet":
+                df.to_parquet(path, engine="pyarrow", compression="zstd", index=keep_index)
+            else:
+                # Large buffer and chunked formatting keep long equity curves
+                # from turning into one small write per few rows
+                with open(path, "w", newline="", buffering=_WRITE_BUFFER_SIZE) as f:
+                    df.to_csv(f, index=keep_index, chunksize=_CSV_CHUNK_ROWS)
+
+        # The per-bar position/holding records are written straight from the lists
+        for name in ("all_positions", "all_holdings"):
+            rows = getattr(portfolio_obj, name)
+            if rows:
+                _write_rows(rows, os.path.join(backtest_path, f"{name}.{file_format}"), file_format)
 
         # Save backtest parameters
-        with open(os.path.join(backtest_path, "backtest_params.json"), "w") as f:
-            json.dump(backtest_params, f, indent=4)
+        _dump_json(backtest_params, os.path.join(backtest_path, "backtest_params.json"))
 
         # Save performance metrics
-        with open(os.path.join(backtest_path, "performance_metrics.json"), "w") as f:
-            json.dump(convert_numpy_types(performance_metrics), f, indent=4)
+        _dump_json(
+            _encode_metrics(performance_metrics),
+            os.path.join(backtest_path, "performance_metrics.json"),
+        )
 
-        # Copy plots to the backtest directory
-        for plot_type, filepath in plot_filepaths.items():
-            if os.path.exists(filepath):
-                os.rename(filepath, os.path.join(backtest_path, os.path.basename(filepath)))
+        # Move plots into the backtest directory unless they were generated there
+        if not plots_in_place:
+            for plot_type, filepath in plot_filepaths.items():
+                _move_into(filepath, backtest_path)
 
-        logger.info(f"Backtest results saved to: {backtest_path}")
+        self._load_cached.cache_clear()
+        logger.info("Backtest results saved to: %s", backtest_path)
+
+    @staticmethod
+    def _dir_signature(backtest_path):
+        """
+        Returns (entry count, newest mtime) for the files in a backtest
+        directory, which changes whenever results are written or removed.
+        """
+        with os.scandir(backtest_path) as it:
+            mtimes = [entry.stat().st_mtime_ns for entry in it]
+        return len(mtimes), max(mtimes, default=0)
 
     def load_backtest(self, backtest_name):
         """
-        Loads backtest data and results.
+        Loads backtest data and results. Repeated loads of an unchanged
+        backtest skip the disk reads; each call still gets its own copies
+        of the frames and dicts, so callers may modify them freely.
         """
         backtest_path = self._get_backtest_path(backtest_name)
         if not os.path.exists(backtest_path):
-            logger.warning(f"Backtest '{backtest_name}' not found at {backtest_path}")
+            logger.warning("Backtest '%s' not found at %s", backtest_name, backtest_path)
             return None
 
+        loaded_data = self._load_cached(backtest_name, self._dir_signature(backtest_path))
+        return {
+            key: value.copy() if isinstance(value, pd.DataFrame) else copy.deepcopy(value)
+            for key, value in loaded_data.items()
+        }
+
+    def _load_uncached(self, backtest_name, signature):
+        """
+        Reads a backtest from disk; signature is only part of the cache key.
+        """
+        backtest_path = self._get_backtest_path(backtest_name)
         loaded_data = {}
 
-        # Load portfolio data
-        equity_curve_path = os.path.join(backtest_path, "equity_curve.csv")
-        if os.path.exists(equity_curve_path):
-            loaded_data["equity_curve"] = pd.read_csv(equity_curve_path, index_col=0, parse_dates=True)
-        
-        all_positions_path = os.path.join(backtest_path, "all_positions.csv")
-        if os.path.exists(all_positions_path):
-            loaded_data["all_positions"] = pd.read_csv(all_positions_path, parse_dates=['datetime'])
-        
-        all_holdings_path = os.path.join(backtest_path, "all_holdings.csv")
-        if os.path.exists(all_holdings_path):
-            loaded_data["all_holdings"] = pd.read_csv(all_holdings_path, parse_dates=['datetime'])
-
-        closed_trades_path = os.path.join(backtest_path, "closed_trades.csv")
-        if os.path.exists(closed_trades_path):
-            loaded_data["closed_trades"] = pd.read_csv(closed_trades_path, parse_dates=['entry_time', 'exit_time'])
+        # Load portfolio data; the files are independent, so read them concurrently
+        names = list(_PORTFOLIO_FRAMES)
+        with ThreadPoolExecutor(max_workers=len(names)) as executor:
+            frames = executor.map(lambda name: _read_frame(backtest_path, name), names)
+            for name, df in zip(names, frames):
+                if df is not None:
+                    loaded_data[name] = df
 
         # Load backtest parameters
         params_path = os.path.join(backtest_path, "backtest_params.json")
         if os.path.exists(params_path):
-            with open(params_path, "r") as f:
-                loaded_data["backtest_params"] = json.load(f)
+            loaded_data["backtest_params"] = _load_json(params_path)
 
         # Load performance metrics
         metrics_path = os.path.join(backtest_path, "performance_metrics.json")
         if os.path.exists(metrics_path):
-            with open(metrics_path, "r") as f:
-                loaded_data["performance_metrics"] = json.load(f)
+            loaded_data["performance_metrics"] = _decode_metrics(_load_json(metrics_path))
 
         # List plot files (not loading content, just paths)
-        loaded_data["plot_files"] = {
-            f.split(".")[0]: os.path.join(backtest_path, f)
-            for f in os.listdir(backtest_path)
-            if f.endswith((".png", ".jpg", ".html"))
-        }
+        with os.scandir(backtest_path) as it:
+            loaded_data["plot_files"] = {
+                entry.name.rsplit(".", 1)[0]: entry.path
+                for entry in it
+                if entry.name.endswith(_PLOT_SUFFIXES) and entry.is_file()
+            }
 
-        logger.info(f"Backtest results loaded from: {backtest_path}")
+        logger.info("Backtest results loaded from: %s", backtest_path)
         return loaded_data
\ No newline at end of file